@@ -11,15 +11,18 @@
 
 import sys
 from functools import update_wrapper
+from types import FunctionType
 
 from mo_dots import get_logger, is_data, to_data, is_many, Data, unwraplist
 
 KWARGS = str("kwargs")
 
 
-def override(kwargs=None):
+def override(kwargs=None, vectorized=False, methods=None):
     """
     :param kwargs: Alternative argument name that will receive all parameters
+    :param vectorized: True IF THE FUNCTION ACCEPTS WHOLE COLUMNS (SEE from_columns)
+    :param methods: WHEN DECORATING A CLASS, THE NAMES OF THE METHODS TO WRAP
 
     THIS DECORATOR WILL PUT ALL PARAMETERS INTO THE `kwargs` ARGUMENT AND
     THEN PUT ALL `kwargs` PARAMETERS INTO THE FUNCTION PARAMETERS. THIS HAS
@@ -31,23 +34,20 @@ def override(kwargs=None):
     1) EXPLICT CALL PARAMETERS
     2) PARAMETERS FOUND IN `kwargs`
     3) DEFAULT VALUES ASSIGNED IN FUNCTION DEFINITION
-    """
 
-    def output(func):
-        code = func.__code__
-        ac, kc, vac, vkc = code.co_argcount, code.co_kwonlyargcount, (code.co_flags & 0x04) // 4, (code.co_flags & 0x08) // 8
-        remainder = get_function_arguments(func)
-        known_args, remainder = remainder[: ac], remainder[ac :]
-        known_kwargs, remainder = known_args + remainder[: kc], remainder[kc :]
-        varargs, remainder = delist(remainder[:vac]), remainder[vac:]
-        varkwargs = delist(remainder[:vkc])
+    USE from_columns() TO CALL THE DECORATED FUNCTION WITH COLUMNS OF
+    PARAMETERS.  IF vectorized, THE FUNCTION IS CALLED ONCE WITH THE WHOLE
+    COLUMNS.
+
+    DECORATING A CLASS WILL WRAP THE methods (DEFAULT: ALL METHODS THAT DECLARE
+    THE `kwargs` PARAMETER) ONCE, AND DO THE SAME FOR ALL SUBCLASSES, VIA
+    __init_subclass__.  SET `__override__ = False` ON A CLASS TO TURN OFF THE
+    INSTRUMENTATION OF THAT CLASS, AND ITS SUBCLASSES.
+    """
 
+    def output(func, signature=None):
+        known_args, known_kwargs, varargs, varkwargs, defaults = signature or analyze_signature(func, kwargs)
         func_name = func.__name__
-        defaults = {k: v for k, v in zip(reversed(known_kwargs), reversed(func.__defaults__ or [])) if v is not None}
-        if func.__kwdefaults__:
-            for k, v in (func.__kwdefaults__ or {}).items():
-                if k != kwargs:
-                    defaults[k] = v
 
         def raise_error(e, a, k):
             packed = k.copy()
@@ -71,6 +71,12 @@ def override(kwargs=None):
                     )
             raise e
 
+        def wrap(wrapper):
+            update_wrapper(wrapper, func)
+            # EVERYTHING from_columns() NEEDS, AND THE MARKER FOR ALREADY WRAPPED
+            wrapper.__override__ = (func, kwargs, vectorized, known_kwargs, varkwargs, defaults, raise_error)
+            return wrapper
+
         if kwargs not in known_kwargs:
             # ADDING A kwargs PARAMETER TO SOME REGULAR METHOD
             def wo_kwargs(*given_args, **given_kwargs):
@@ -82,7 +88,7 @@ def override(kwargs=None):
                 except TypeError as e:
                     raise_error(e, a, k)
 
-            return update_wrapper(wo_kwargs, func)
+            return wrap(wo_kwargs)
 
         elif func_name in ("__init__", "__new__") or known_kwargs[0] in ("self", "cls"):
 
@@ -109,7 +115,7 @@ def override(kwargs=None):
                         trace = get_traceback(0)
                     raise_error(e, a, k)
 
-            return update_wrapper(w_bound_method, func)
+            return wrap(w_bound_method)
 
         else:
 
@@ -130,7 +136,7 @@ def override(kwargs=None):
                 except TypeError as e:
                     raise_error(e, a, k)
 
-            return update_wrapper(w_kwargs, func)
+            return wrap(w_kwargs)
 
     def params_pack(params, varkwargs,  *args):
         """
@@ -143,32 +149,170 @@ def override(kwargs=None):
             for k, v in a.items():
                 if str(k) != kwargs:
                     all_args[str(k)] = v
-        _args = []
-        if params and params[0] in ("self", "cls"):
-            k, *params = params
-            s = all_args.get(k)
-            if s is not None:
-                _args.append(s)
-                del all_args[k]
-
-        if varkwargs:
-            # fill the **varkwargs parameter with all remaining parameters
-            top_args = all_args
-        else:
-            top_args = {k: all_args[k] for k in params if k in all_args}
-        if kwargs in params:
-            top_args[kwargs] = Data(**all_args)
-        return _args, top_args
+        return pack_args(params, varkwargs, kwargs, all_args)
+
+    def output_class(cls):
+        def instrument(c):
+            if not getattr(c, "__override__", True):
+                return
+            for name, member in list(c.__dict__.items()):
+                if isinstance(member, (staticmethod, classmethod)):
+                    descriptor, func = type(member), member.__func__
+                else:
+                    descriptor, func = None, member
+                if not isinstance(func, FunctionType) or getattr(func, "__override__", False):
+                    # NOT A METHOD, OR ALREADY WRAPPED (INHERITED WRAPPERS ARE NOT IN __dict__)
+                    continue
+                if methods is not None and name not in methods:
+                    continue
+                signature = analyze_signature(func, kwargs)
+                if methods is None and kwargs not in signature[1]:
+                    continue
+                wrapper = output(func, signature)
+                setattr(c, name, descriptor(wrapper) if descriptor else wrapper)
+
+        previous = cls.__dict__.get("__init_subclass__")
+
+        def __init_subclass__(sub, **kw):
+            if previous is None:
+                super(cls, sub).__init_subclass__(**kw)
+            else:
+                previous.__func__(sub, **kw)
+            instrument(sub)
+
+        instrument(cls)
+        cls.__init_subclass__ = classmethod(__init_subclass__)
+        return cls
+
+    def decorate(target):
+        if isinstance(target, type):
+            if vectorized:
+                get_logger().error("Expecting a function, not class {name} (vectorized)", name=target.__name__)
+            return output_class(target)
+        if methods is not None:
+            get_logger().error("Expecting a class, not {name} (methods)", name=target.__name__)
+        return output(target)
 
     if isinstance(kwargs, str):
         # COMPLEX VERSION @override(kwargs="other")
-        return output
+        return decorate
     elif kwargs == None:
+        if vectorized or methods is not None:
+            # @override(vectorized=True) OR @override(methods=[...])
+            kwargs = KWARGS
+            return decorate
         raise NotImplementedError("use @override without calling")
     else:
         # SIMPLE VERSION @override
         func, kwargs = kwargs, KWARGS
-        return output(func)
+        return decorate(func)
+
+
+def from_columns(func, columns, settings=None, **given_kwargs):
+    """
+    CALL func ONCE PER ROW OF columns (OR ONCE, IF func IS vectorized)
+
+    :param func: A FUNCTION DECORATED WITH @override, OR A BOUND METHOD OF ONE
+    :param columns: dict OF EQUAL-LENGTH SEQUENCES (list, array.array, numpy.ndarray), ONE PER PARAMETER
+    :param settings: SCALAR PARAMETERS, SAME AS `kwargs`
+    :param given_kwargs: SCALAR PARAMETERS, OVERRIDING settings
+    :return: list OF RESULTS, ONE PER ROW (OR THE SINGLE RESULT, IF vectorized)
+    """
+    signature = getattr(func, "__override__", None)
+    if not isinstance(signature, tuple):
+        get_logger().error("Expecting a function decorated with @override, not {name}", name=func.__name__)
+    bound_to = getattr(func, "__self__", None)
+    func, kwargs, vectorized, known_kwargs, varkwargs, defaults, raise_error = signature
+    if bound_to is not None and known_kwargs and known_kwargs[0] in ("self", "cls"):
+        given_kwargs[known_kwargs[0]] = bound_to
+
+    # RESOLVE PRECEDENCE ONCE, NOT PER ROW
+    scalars = {}
+    for source in (defaults, settings or {}, given_kwargs):
+        for k, v in source.items():
+            if str(k) != kwargs:
+                scalars[str(k)] = v
+    names, values = [], []
+    for k, v in columns.items():
+        k = str(k)
+        if k == kwargs:
+            continue
+        if k in given_kwargs:
+            get_logger().error("Expecting {name} as a column, or as a parameter, not both", name=k)
+        if not hasattr(v, "__len__"):
+            get_logger().error("Expecting column {name} to be a sequence, not {type}", name=k, type=type(v).__name__)
+        scalars.pop(k, None)
+        names.append(k)
+        values.append(v)
+    num_rows = len(values[0]) if values else 0
+    if any(len(v) != num_rows for v in values):
+        get_logger().error(
+            "Expecting columns of equal length, not {lengths}", lengths={n: len(v) for n, v in zip(names, values)},
+        )
+
+    if vectorized:
+        all_args = scalars.copy()
+        all_args.update(zip(names, values))
+        a, k = pack_args(known_kwargs, varkwargs, kwargs, all_args)
+        try:
+            return func(*a, **k)
+        except TypeError as e:
+            raise_error(e, a, k)
+
+    result = []
+    if kwargs in known_kwargs or (known_kwargs and known_kwargs[0] in ("self", "cls")):
+        # EVERY ROW NEEDS ITS OWN kwargs, OR ITS OWN self
+        for row in zip(*values):
+            all_args = scalars.copy()
+            all_args.update(zip(names, row))
+            a, k = pack_args(known_kwargs, varkwargs, kwargs, all_args)
+            try:
+                result.append(func(*a, **k))
+            except TypeError as e:
+                raise_error(e, a, k)
+        return result
+
+    # ONLY PASS THE COLUMNS THE FUNCTION ACCEPTS
+    if varkwargs:
+        constant = scalars
+        top = list(range(len(names)))
+    else:
+        constant = {p: scalars[p] for p in known_kwargs if p in scalars}
+        top = [i for i, n in enumerate(names) if n in known_kwargs]
+    top_names = [names[i] for i in top]
+    for row in zip(*(values[i] for i in top)) if top else [()] * num_rows:
+        k = constant.copy()
+        k.update(zip(top_names, row))
+        try:
+            result.append(func(**k))
+        except TypeError as e:
+            raise_error(e, [], k)
+    return result
+
+
+def pack_args(params, varkwargs, kwargs, all_args):
+    """
+    :param params: THE FUNCTION PARAMETER NAMES
+    :param kwargs: NAME OF THE PARAMETER THAT RECEIVES ALL PARAMETERS
+    :param all_args: dict OF ALL PARAMETERS (WILL BE MODIFIED)
+    :return: (args, kwargs) pair
+    """
+    _args = []
+    if params and params[0] in ("self", "cls"):
+        k, *params = params
+        s = all_args.get(k)
+        if s is not None:
+            _args.append(s)
+            del all_args[k]
+
+    if varkwargs:
+        # fill the **varkwargs parameter with all remaining parameters
+        top_args = all_args
+    else:
+        top_args = {k: all_args[k] for k in params if k in all_args}
+    if kwargs in params:
+        top_args[kwargs] = Data(**all_args)
+    return _args, top_args
 
 
 def get_traceback(start):
@@ -199,6 +343,29 @@ def _parse_traceback(tb):
     return trace
 
 
+def analyze_signature(func, kwargs=KWARGS):
+    """
+    :param func: THE FUNCTION TO INSPECT
+    :param kwargs: NAME OF THE PARAMETER THAT RECEIVES ALL PARAMETERS
+    :return: (known_args, known_kwargs, varargs, varkwargs, defaults) TUPLE
+    """
+    code = func.__code__
+    ac, kc, vac, vkc = code.co_argcount, code.co_kwonlyargcount, (code.co_flags & 0x04) // 4, (code.co_flags & 0x08) // 8
+    remainder = get_function_arguments(func)
+    known_args, remainder = remainder[: ac], remainder[ac :]
+    known_kwargs, remainder = known_args + remainder[: kc], remainder[kc :]
+    varargs, remainder = delist(remainder[:vac]), remainder[vac:]
+    varkwargs = delist(remainder[:vkc])
+
+    defaults = {k: v for k, v in zip(reversed(known_kwargs), reversed(func.__defaults__ or [])) if v is not None}
+    if func.__kwdefaults__:
+        for k, v in (func.__kwdefaults__ or {}).items():
+            if k != kwargs:
+                defaults[k] = v
+
+    return known_args, known_kwargs, varargs, varkwargs, defaults
+
+
 def get_function_arguments(func):
     return func.__code__.co_varnames
 
@@ -11,11 +11,19 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+from array import array
+from unittest import skipIf
+
 from mo_dots import is_missing
 from mo_future import Mapping
 from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
 
-from mo_kwargs import override
+from mo_kwargs import override, from_columns
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 kw = {"required": 1, "optional": 2}
 
@@ -332,6 +340,140 @@ class TestOverride(FuzzyTestCase):
         self.assertEqual(kw_default(a=3), {'b': 1, 'c': 2})
         self.assertEqual( {'b': 1, 'c': 2, 'a':3},kw_default(a=3))
 
+    def test_columns_basic(self):
+        result = from_columns(basic, {"required": array("i", [1, 2, 3]), "other": [0, 0, 0]})
+        self.assertEqual(result, [{"required": 1, "optional": 3}, {"required": 2, "optional": 3}, {"required": 3, "optional": 3}])
+
+    def test_columns_w_settings(self):
+        result = from_columns(basic, {"required": [1, 2]}, {"optional": 9})
+        self.assertEqual(result, [{"required": 1, "optional": 9}, {"required": 2, "optional": 9}])
+
+    def test_columns_w_override(self):
+        result = from_columns(basic, {"required": [1, 2]}, {"optional": 9}, optional=7)
+        self.assertEqual(result, [{"required": 1, "optional": 7}, {"required": 2, "optional": 7}])
+
+    def test_columns_override_settings(self):
+        result = from_columns(basic, {"optional": [4, 5]}, kw)
+        self.assertEqual(result, [{"required": 1, "optional": 4}, {"required": 1, "optional": 5}])
+
+    def test_columns_w_kwargs(self):
+        result = from_columns(required, {"required": [1, 2]}, {"optional": 9, "other": 0})
+        self.assertEqual(result[1], {"required": 2, "optional": 9, "kwargs": {"required": 2, "optional": 9, "other": 0}})
+
+    @skipIf(numpy is None, "numpy not installed")
+    def test_columns_numpy(self):
+        result = from_columns(basic, {"required": numpy.array([1, 2])}, optional=5)
+        self.assertEqual(result, [{"required": 1, "optional": 5}, {"required": 2, "optional": 5}])
+
+    @skipIf(numpy is None, "numpy not installed")
+    def test_columns_numpy_vectorized(self):
+        result = from_columns(scale, {"values": numpy.array([1, 2])})
+        self.assertEqual(list(result), [3, 6])
+
+    def test_columns_and_parameter(self):
+        with self.assertRaises("Expecting optional as a column, or as a parameter, not both"):
+            from_columns(basic, {"required": [1, 2], "optional": [5, 6]}, optional=9)
+
+    def test_columns_not_sized(self):
+        with self.assertRaises("Expecting column required to be a sequence"):
+            from_columns(basic, {"required": (i for i in range(2))})
+
+    def test_columns_not_decorated(self):
+        with self.assertRaises("Expecting a function decorated with @override"):
+            from_columns(len, {"obj": [[1]]})
+
+    def test_columns_unequal_length(self):
+        with self.assertRaises("Expecting columns of equal length"):
+            from_columns(basic, {"required": [1], "optional": [1, 2]})
+
+    def test_columns_missing_required(self):
+        with self.assertRaises("Problem calling "):
+            from_columns(basic, {"optional": [1, 2]})
+
+    def test_columns_method(self):
+        obj = TestObject(required=0)
+        result = from_columns(TestObject.required_, {"required": [1, 2]}, self=obj)
+        self.assertEqual(result, [{"required": 1, "optional": 3}, {"required": 2, "optional": 3}])
+
+    def test_columns_through_instance(self):
+        obj = TestObject(required=0)
+        result = from_columns(obj.kwargs_, {"required": [1, 2]}, {"optional": 9})
+        self.assertEqual(result, [{"kwargs": {"required": 1, "optional": 9}}, {"kwargs": {"required": 2, "optional": 9}}])
+
+    def test_columns_missing_self(self):
+        with self.assertRaises("Expecting parameter [\"self\"]"):
+            from_columns(TestObject.required_, {"required": [1, 2]})
+
+    def test_methods_on_function(self):
+        with self.assertRaises("Expecting a class"):
+            override(methods=["basic"])(basic)
+
+    def test_vectorized_on_class(self):
+        with self.assertRaises("Expecting a function"):
+            override(vectorized=True)(SelectedObject)
+
+    def test_columns_vectorized(self):
+        result = from_columns(scale, {"values": [1, 2, 3]}, factor=2)
+        self.assertEqual(result, [2, 4, 6])
+
+    def test_vectorized_called_normally(self):
+        self.assertEqual(scale(values=[1, 2]), [3, 6])
+
+    def test_class_init(self):
+        result = ClassObject(kw)
+        self.assertEqual(result.required, 1)
+        self.assertEqual(result.optional, 2)
+
+    def test_class_method_w_kwargs(self):
+        result = ClassObject(required=0).settings(kwargs=kw)
+        self.assertEqual(result, kw)
+
+    def test_class_method_wo_kwargs_not_wrapped(self):
+        self.assertFalse(hasattr(ClassObject.plain, "__override__"))
+        with self.assertRaises("got an unexpected keyword argument 'b'"):
+            ClassObject(required=0).plain(a=1, b=2)
+
+    def test_subclass_init(self):
+        result = SubClassObject({"required": 1, "extra": 3})
+        self.assertEqual(result.required, 1)
+        self.assertEqual(result.extra, 3)
+
+    def test_subclass_method(self):
+        result = SubClassObject(required=0, extra=0).settings(kwargs=kw)
+        self.assertEqual(result, {"sub": kw})
+
+    def test_subclass_inherits_wrapper(self):
+        self.assertIs(InheritingObject.__dict__.get("__init__"), None)
+        self.assertIs(InheritingObject.__init__, ClassObject.__init__)
+        self.assertIs(InheritingObject.settings, ClassObject.settings)
+        self.assertEqual(InheritingObject(kw).required, 1)
+
+    def test_subclass_instrumentation_off(self):
+        self.assertFalse(hasattr(UninstrumentedObject.settings, "__override__"))
+        self.assertFalse(hasattr(UninstrumentedChild.settings, "__override__"))
+
+    def test_subclass_instrumentation_back_on(self):
+        self.assertTrue(hasattr(ReinstrumentedChild.settings, "__override__"))
+        self.assertEqual(ReinstrumentedChild(required=0).settings(kwargs=kw), kw)
+
+    def test_class_new(self):
+        result = ClassWithDescriptors(kwargs={"x": 2, "other": 0})
+        self.assertEqual(result.x, 2)
+        self.assertEqual(result.settings, {"x": 2, "other": 0})
+
+    def test_class_classmethod(self):
+        result = ClassWithDescriptors.make(kwargs={"x": 3})
+        self.assertIsInstance(result, ClassWithDescriptors)
+        self.assertEqual(result.x, 3)
+
+    def test_class_staticmethod(self):
+        result = ClassWithDescriptors.static(x=4, other=0)
+        self.assertEqual(result, {"x": 4, "other": 0})
+
+    def test_class_selected_methods(self):
+        self.assertEqual(SelectedObject().chosen(kwargs={"a": 1, "b": 2}), 1)
+        self.assertFalse(hasattr(SelectedObject.ignored, "__override__"))
+
 
 @override
 def basic(required, optional=3):
@@ -372,6 +514,11 @@ def oops_self(self, kwargs):
 def oops_kwargs(self, kwargs):
     required()  # SHOULD RAISE TypeError
 
+@override(vectorized=True)
+def scale(values, factor=3, kwargs=None):
+    return [v * factor for v in values]
+
+
 @override
 def kw_default(*, a, b=1, c=2, kwargs=None):
     return kwargs
@@ -409,3 +556,75 @@ class TestObject(object):
     @override
     def kw_default(self, *, a, b=1, c=2, kwargs=None):
         return kwargs
+
+
+@override
+class ClassObject(object):
+    def __init__(self, required, optional=3, kwargs=None):
+        self.required = required
+        self.optional = optional
+
+    def settings(self, kwargs=None):
+        return kwargs
+
+    def plain(self, a):
+        return a
+
+
+class SubClassObject(ClassObject):
+    def __init__(self, extra, kwargs=None):
+        ClassObject.__init__(self, kwargs=kwargs)
+        self.extra = extra
+
+    def settings(self, kwargs=None):
+        return {"sub": kwargs}
+
+
+class UninstrumentedObject(ClassObject):
+    __override__ = False
+
+    def settings(self, kwargs=None):
+        return kwargs
+
+
+class UninstrumentedChild(UninstrumentedObject):
+    def settings(self, kwargs=None):
+        return kwargs
+
+
+class ReinstrumentedChild(UninstrumentedChild):
+    __override__ = True
+
+    def settings(self, kwargs=None):
+        return kwargs
+
+
+class InheritingObject(ClassObject):
+    def other(self):
+        return None
+
+
+@override(methods=["chosen"])
+class SelectedObject(object):
+    def chosen(self, a):
+        return a
+
+    def ignored(self, a):
+        return a
+
+
+@override
+class ClassWithDescriptors(object):
+    def __new__(cls, x=1, kwargs=None):
+        self = object.__new__(cls)
+        self.x = x
+        self.settings = kwargs
+        return self
+
+    @classmethod
+    def make(cls, x=1, kwargs=None):
+        return cls(x=x)
+
+    @staticmethod
+    def static(x=1, kwargs=None):
+        return kwargs